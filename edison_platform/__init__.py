@@ -6,7 +6,9 @@ making it easy to interact with the Edison platform for scientific research task
 """
 
 from .client import EdisonPlatformClient
+from .cache import CachedEdisonClient
+from .env import ensure_env_loaded
 from .job_types import JobTypes
 
 __version__ = "0.1.0"
-__all__ = ["EdisonPlatformClient", "JobTypes"]
+__all__ = ["EdisonPlatformClient", "CachedEdisonClient", "JobTypes", "ensure_env_loaded"]
@@ -0,0 +1,239 @@
+"""
+Response caching for the Edison Platform Client.
+
+Provides ``CachedEdisonClient``, a drop-in ``EdisonPlatformClient`` that
+answers repeated (or, optionally, nearly identical) queries from a local
+cache instead of running the task again.
+"""
+
+import difflib
+import json
+import os
+import pickle
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .client import EdisonPlatformClient, _BoundedCache
+
+_WHITESPACE = re.compile(r"\s+")
+
+# (job name, JSON of the remaining task fields, normalized query)
+_CacheKey = Tuple[str, str, str]
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivially different queries share a key."""
+    return _WHITESPACE.sub(" ", query.strip().lower())
+
+
+class CachedEdisonClient(EdisonPlatformClient):
+    """
+    EdisonPlatformClient that reuses responses for repeated queries.
+    
+    Every task goes through ``run_task``/``arun_task``, so the convenience
+    methods (``literature_search``, ``precedent_search``, ``analyze_data`` and
+    ``chemistry_task``) are cached as well. Queries are matched after
+    lower-casing and collapsing whitespace; all other task fields must match
+    exactly. Only successful responses are cached; failed, cancelled,
+    truncated and unfinished (timed-out) ones are not.
+    
+    Attributes:
+        similarity_threshold (float, optional): Minimum ``difflib`` ratio for
+            a cached query to answer a new one, or None for exact matches only
+        cache_path (str, optional): SQLite file the cache is persisted to
+    
+    Example:
+        >>> client = CachedEdisonClient(cache_path="~/.edison_cache.sqlite")
+        >>> client.literature_search("What causes ALS?")   # runs the task
+        >>> client.literature_search("what causes  ALS?")  # served from cache
+    """
+    
+    __slots__ = ("similarity_threshold", "cache_path", "_responses", "_lock", "_db_lock")
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        verbose: bool = True,
+        show_progress: bool = True,
+        maxsize: int = 256,
+        similarity_threshold: Optional[float] = None,
+        cache_path: Optional[str] = None,
+    ):
+        """
+        Initialize the caching client.
+        
+        Args:
+            api_key (str, optional): Edison API key, as for EdisonPlatformClient.
+            verbose (bool): Enable verbose terminal output (default: True)
+            show_progress (bool): Show progress indicators during task execution (default: True)
+            maxsize (int): Number of responses kept in memory (default: 256)
+            similarity_threshold (float, optional): Also reuse a response whose
+                query is at least this similar (0-1, e.g. 0.92). Near matches
+                can return an answer to a slightly different question, so this
+                is off by default.
+            cache_path (str, optional): SQLite file to persist responses in, so
+                later processes start warm. Responses are stored pickled; only
+                point this at a file you trust.
+        
+        Raises:
+            ValueError: If no API key is provided or found in environment.
+        """
+        super().__init__(api_key=api_key, verbose=verbose, show_progress=show_progress)
+        self.similarity_threshold = similarity_threshold
+        self.cache_path = os.path.expanduser(cache_path) if cache_path else None
+        self._responses = _BoundedCache(maxsize=maxsize)
+        # iter_tasks runs tasks from worker threads, and _BoundedCache is not
+        # thread-safe: the near-match scan must not see a concurrent set()
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        if self.cache_path:
+            self._load()
+    
+    @classmethod
+    def _cache_key(cls, task_data: Dict[str, Any]) -> Optional[_CacheKey]:
+        """Return the cache key for a task, or None if it has no string query."""
+        query = task_data.get("query")
+        if not isinstance(query, str):
+            return None
+        job_name = str(cls._job_name(task_data))
+        extras = {k: v for k, v in task_data.items() if k not in ("name", "query")}
+        return job_name, json.dumps(extras, sort_keys=True, default=str), _normalize_query(query)
+    
+    def _lookup(self, key: _CacheKey) -> Any:
+        """Return the cached response for ``key``, falling back to the closest near match."""
+        with self._lock:
+            return self._find(key)
+    
+    def _find(self, key: _CacheKey) -> Any:
+        """Look ``key`` up in memory; the caller holds ``self._lock``."""
+        response = self._responses.get(key)
+        if response is not None or self.similarity_threshold is None:
+            return response
+        
+        job_name, extras, query = key
+        matcher = difflib.SequenceMatcher(None, b=query, autojunk=False)
+        best_ratio, best_key = self.similarity_threshold, None
+        for (other_job, other_extras, other_query), _ in self._responses.items():
+            if other_job != job_name or other_extras != extras:
+                continue
+            matcher.set_seq1(other_query)
+            # The quick upper bounds skip most candidates without a full diff
+            if (matcher.real_quick_ratio() >= best_ratio
+                    and matcher.quick_ratio() >= best_ratio):
+                ratio = matcher.ratio()
+                if ratio >= best_ratio:
+                    best_ratio, best_key = ratio, (other_job, other_extras, other_query)
+        return self._responses.get(best_key) if best_key is not None else None
+    
+    def _store(self, key: _CacheKey, response: Any) -> None:
+        """Cache a successful response, persisting it if configured."""
+        # Failed or unfinished (timed-out) responses are never cached, so a
+        # retry reaches the API
+        if not self._succeeded(response):
+            return
+        with self._lock:
+            self._responses.set(key, response)
+        if self.cache_path:
+            try:
+                payload = pickle.dumps(response)
+            except Exception as e:
+                self.logger.warning("Response not persisted, cannot pickle it: %s", e)
+                return
+            with self._database() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (*key, payload),
+                )
+    
+    @contextmanager
+    def _database(self) -> Iterator[sqlite3.Connection]:
+        """Open the cache file for one transaction, committing and closing it afterwards."""
+        with self._db_lock:
+            conn = sqlite3.connect(self.cache_path)
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS responses ("
+                        "job TEXT, extras TEXT, query TEXT, response BLOB, "
+                        "PRIMARY KEY (job, extras, query))"
+                    )
+                    yield conn
+            finally:
+                conn.close()
+    
+    def _load(self) -> None:
+        """Warm the in-memory cache with the most recent persisted responses."""
+        with self._database() as conn:
+            rows = conn.execute(
+                "SELECT job, extras, query, response FROM responses "
+                "ORDER BY rowid DESC LIMIT ?",
+                (self._responses.maxsize,),
+            ).fetchall()
+        for job, extras, query, payload in reversed(rows):
+            try:
+                self._responses.set((job, extras, query), pickle.loads(payload))
+            except Exception as e:
+                self.logger.warning("Skipping unreadable cache entry: %s", e)
+    
+    def clear_cache(self) -> None:
+        """
+        Forget every cached response, including the persisted ones.
+        
+        Example:
+            >>> client = CachedEdisonClient(cache_path="~/.edison_cache.sqlite")
+            >>> client.clear_cache()
+        """
+        with self._lock:
+            self._responses.clear()
+        if self.cache_path:
+            with self._database() as conn:
+                conn.execute("DELETE FROM responses")
+    
+    def run_task(self, task_data: Dict[str, Any]) -> Any:
+        """
+        Run a task synchronously, answering from the cache when possible.
+        
+        Args:
+            task_data (dict): Task request data, as for EdisonPlatformClient.run_task.
+        
+        Returns:
+            The task response with results.
+        """
+        key = self._cache_key(task_data)
+        if key is None:
+            return super().run_task(task_data)
+        
+        cached = self._lookup(key)
+        if cached is not None:
+            self._log_status("Using cached result for this query", "success")
+            return cached
+        
+        response = super().run_task(task_data)
+        self._store(key, response)
+        return response
+    
+    async def arun_task(self, task_data: Dict[str, Any]) -> Any:
+        """
+        Run a task asynchronously, answering from the cache when possible.
+        
+        Args:
+            task_data (dict): Task request data, as for EdisonPlatformClient.arun_task.
+        
+        Returns:
+            The task response with results.
+        """
+        key = self._cache_key(task_data)
+        if key is None:
+            return await super().arun_task(task_data)
+        
+        cached = self._lookup(key)
+        if cached is not None:
+            self.logger.info("Using cached result for async task: %s", key[0])
+            return cached
+        
+        response = await super().arun_task(task_data)
+        self._store(key, response)
+        return response
@@ -5,31 +5,234 @@ A wrapper around the edison-client library providing a clean interface
 for interacting with the Edison Scientific platform.
 """
 
+import asyncio
 import os
 import logging
 import sys
+import threading
 import time
 import json
-from typing import Dict, Any, Optional, Callable
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, AsyncIterator, FrozenSet, Iterable, Iterator, List, Optional, Callable, Hashable
 from edison_client import EdisonClient, JobNames
 
-try:
-    from tqdm import tqdm
-    TQDM_AVAILABLE = True
-except ImportError:
-    TQDM_AVAILABLE = False
+# Job names used by the convenience methods, bound once at import
+_LITERATURE = JobNames.LITERATURE
+_PRECEDENT = JobNames.PRECEDENT
+_ANALYSIS = JobNames.ANALYSIS
+_MOLECULES = JobNames.MOLECULES
+
+# Lower-cased task statuses after which a task never changes again; mirrors
+# edison_client's ExecutionStatus.terminal_states()
+_TERMINAL_STATUSES: FrozenSet[str] = frozenset({"success", "fail", "cancelled", "truncated"})
+
+# Seconds to wait for a task to finish; mirrors edison_client's
+# DEFAULT_AGENT_TIMEOUT used by run_tasks_until_done
+_DEFAULT_TIMEOUT: float = 2400
 
 try:
-    from colorama import init, Fore, Style
-    init(autoreset=True)
-    COLORAMA_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    COLORAMA_AVAILABLE = False
-    # Create dummy color classes if colorama not available
-    class Fore:
-        GREEN = YELLOW = BLUE = CYAN = RED = MAGENTA = RESET = ""
-    class Style:
-        BRIGHT = RESET_ALL = ""
+    ORJSON_AVAILABLE = False
+
+# tqdm and colorama are only needed for terminal output. They are imported
+# on first use by a verbose or progress-enabled client, so plain library use
+# neither pays for them nor has colorama wrap stdout/stderr.
+tqdm = None
+TQDM_AVAILABLE = False
+COLORAMA_AVAILABLE = False
+_STATUS_COLORS: Dict[str, str] = {}
+_RESET = ""
+_UI_LOADED = False
+_UI_LOCK = threading.Lock()
+
+_LOGGING_READY = threading.Event()
+_LOGGING_LOCK = threading.Lock()
+
+
+def _is_closed(client: EdisonClient) -> bool:
+    return getattr(client, "_closed", False) is True
+
+
+def _ensure_ui() -> None:
+    """Import the optional terminal UI dependencies and build the color table once."""
+    global tqdm, TQDM_AVAILABLE, COLORAMA_AVAILABLE, _STATUS_COLORS, _RESET, _UI_LOADED
+    if _UI_LOADED:
+        return
+    with _UI_LOCK:
+        if _UI_LOADED:
+            return
+        try:
+            from tqdm import tqdm as _tqdm
+            tqdm = _tqdm
+            TQDM_AVAILABLE = True
+        except ImportError:
+            TQDM_AVAILABLE = False
+        
+        try:
+            from colorama import init, Fore, Style
+            init(autoreset=True)
+            _STATUS_COLORS = {
+                "info": Fore.CYAN,
+                "success": Fore.GREEN,
+                "warning": Fore.YELLOW,
+                "error": Fore.RED,
+                "progress": Fore.BLUE,
+            }
+            _RESET = Style.RESET_ALL
+            COLORAMA_AVAILABLE = True
+        except ImportError:
+            COLORAMA_AVAILABLE = False
+        _UI_LOADED = True
+
+
+def _configure_logging() -> None:
+    """Send the package's INFO logs to stderr, configuring the logger only once.
+    
+    Only the ``edison_platform`` logger is touched, never the root logger. If
+    the application has already configured logging, neither a handler nor a
+    level is set, so its own levels decide what is shown.
+    """
+    if _LOGGING_READY.is_set():
+        return
+    with _LOGGING_LOCK:
+        if _LOGGING_READY.is_set():
+            return
+        package_logger = logging.getLogger("edison_platform")
+        if not package_logger.handlers and not logging.getLogger().handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                datefmt='%H:%M:%S'
+            ))
+            package_logger.addHandler(handler)
+            if package_logger.level == logging.NOTSET:
+                package_logger.setLevel(logging.INFO)
+        _LOGGING_READY.set()
+
+
+_BANNER = "=" * 60
+
+# (epoch second, "HH:MM:SS") of the last formatted timestamp
+_last_timestamp = (-1, "")
+
+
+def _timestamp() -> str:
+    """Return the local time as HH:MM:SS, formatting at most once per second."""
+    global _last_timestamp
+    now = int(time.time())
+    second, text = _last_timestamp
+    if now != second:
+        text = time.strftime("%H:%M:%S", time.localtime(now))
+        _last_timestamp = (now, text)
+    return text
+
+
+def _truncate(text: str, limit: int = 100) -> str:
+    """Shorten ``text`` to ``limit`` characters, marking the cut with an ellipsis."""
+    head = text[:limit + 1]
+    if len(head) > limit:
+        return f"{head[:limit]}..."
+    return head
+
+
+# Characters json.dumps escapes as \uXXXX but orjson writes raw (DEL and non-ASCII)
+_ORJSON_UNSAFE_CHARS = re.compile(r"[^\x00-\x7e]")
+
+
+def _orjson_matches_json(value: Any) -> bool:
+    """
+    Return True if orjson renders ``value`` byte-for-byte like json.dumps.
+    
+    That holds for str-keyed dicts, lists, bools, None, 64-bit ints and
+    strings without DEL or non-ASCII characters. Floats (NaN becomes null,
+    exponents are spelled differently), wider ints (orjson raises), non-str
+    keys and other types all go through json.dumps instead.
+    """
+    if value is None or isinstance(value, bool):
+        return True
+    if isinstance(value, str):
+        return _ORJSON_UNSAFE_CHARS.search(value) is None
+    if isinstance(value, int):
+        return -2 ** 63 <= value < 2 ** 64
+    if isinstance(value, list):
+        return all(_orjson_matches_json(item) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and _orjson_matches_json(key) and _orjson_matches_json(item)
+            for key, item in value.items()
+        )
+    return False
+
+
+def _dumps(value: Any) -> str:
+    """Render a dict/list parameter as indented, key-sorted JSON, exactly as json.dumps does."""
+    if ORJSON_AVAILABLE and _orjson_matches_json(value):
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(value, indent=2, sort_keys=True)
+
+
+def _format_parameters(params: Dict[str, Any]) -> List[str]:
+    """Render keyword parameters as the ``Parameters:`` block of a prompt."""
+    lines = ["Parameters:"]
+    for key, value in params.items():
+        if isinstance(value, (dict, list)):
+            value_str = _dumps(value)
+        else:
+            value_str = str(value)
+        lines.append(f"- {key}: {value_str}")
+    return lines
+
+
+class _BoundedCache:
+    """Small LRU mapping with an optional time-to-live for each entry."""
+    
+    __slots__ = ("maxsize", "ttl", "_data")
+    
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+    
+    def get(self, key: Hashable) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> Any:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+    
+    def items(self) -> List[tuple]:
+        """Return the unexpired ``(key, value)`` pairs, oldest first."""
+        now = time.monotonic()
+        return [
+            (key, value)
+            for key, (expires_at, value) in self._data.items()
+            if expires_at is None or now < expires_at
+        ]
+    
+    def clear(self) -> None:
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class EdisonPlatformClient:
@@ -39,11 +242,30 @@ class EdisonPlatformClient:
     This class provides both synchronous and asynchronous methods for
     submitting and retrieving scientific research tasks.
     
+    The underlying ``EdisonClient`` is created on first use and owned by this
+    instance. It keeps a pooled, keep-alive HTTP client, so a single
+    ``EdisonPlatformClient`` should be reused across calls (or used as a
+    context manager) rather than rebuilt per request. Its async connections
+    are bound to the event loop that first uses them, so use a new instance
+    for each ``asyncio.run``.
+    
     Attributes:
         api_key (str): The API key for authentication
         client (EdisonClient): The underlying Edison client instance
     """
     
+    __slots__ = (
+        "api_key",
+        "_client",
+        "_client_lock",
+        "logger",
+        "verbose",
+        "show_progress",
+        "_task_cache",
+        "_query_cache",
+        "_inflight",
+    )
+    
     def __init__(self, api_key: Optional[str] = None, verbose: bool = True, show_progress: bool = True):
         """
         Initialize the Edison Platform Client.
@@ -65,38 +287,131 @@ class EdisonPlatformClient:
                 "EDISON_API_KEY environment variable."
             )
         
-        self.client = EdisonClient(api_key=self.api_key)
+        self._client: Optional[EdisonClient] = None
+        self._client_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
         self.verbose = verbose
         self.show_progress = show_progress
-        
+        # Results of tasks that reached a terminal state never change again
+        self._task_cache = _BoundedCache(maxsize=1024)
+        # Opt-in cache for convenience searches, keyed on (job name, query)
+        self._query_cache = _BoundedCache(maxsize=128, ttl=3600)
+        # Running arun_task calls as [task, waiter count], keyed on the request
+        self._inflight: Dict[str, list] = {}
+        
+        if self.verbose or self.show_progress:
+            _ensure_ui()
         # Configure logging to show INFO level if verbose
         if self.verbose:
-            logging.basicConfig(
-                level=logging.INFO,
-                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                datefmt='%H:%M:%S'
+            _configure_logging()
+    
+    @property
+    def client(self) -> EdisonClient:
+        """The underlying EdisonClient, created on first use."""
+        client = self._client
+        if client is None or _is_closed(client):
+            # iter_tasks reads this from worker threads; build only one client
+            with self._client_lock:
+                client = self._client
+                if client is None or _is_closed(client):
+                    client = self._client = EdisonClient(api_key=self.api_key)
+        return client
+    
+    @client.setter
+    def client(self, value: EdisonClient) -> None:
+        self._client = value
+    
+    def __enter__(self) -> "EdisonPlatformClient":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections held by the underlying client.
+        
+        Example:
+            >>> with EdisonPlatformClient(api_key="your_key") as client:
+            ...     client.literature_search("What is known about BRCA1?")
+        """
+        if self._client is not None:
+            self._client.close()
+    
+    async def __aenter__(self) -> "EdisonPlatformClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP connections, awaiting the async ones.
+        
+        Prefer this over ``close`` inside a running event loop, where async
+        connections can only be closed on a best-effort basis.
+        
+        Example:
+            >>> async with EdisonPlatformClient(api_key="your_key") as client:
+            ...     await client.arun_task(task)
+        """
+        if self._client is not None:
+            await self._client.aclose()
+    
+    @staticmethod
+    def _job_name(task_data: Dict[str, Any]) -> str:
+        """
+        Return the job name of a task request, validating it before any network I/O.
+        
+        Raises:
+            TypeError: If ``name`` is missing or is not a JobNames member or string.
+        """
+        job_name = task_data.get("name")
+        if not isinstance(job_name, (JobNames, str)):
+            raise TypeError(
+                "task_data['name'] must be a JobNames member or job name string, "
+                f"got {job_name!r}"
             )
+        return job_name
+    
+    @staticmethod
+    def _status_of(result: Any) -> Optional[str]:
+        """Return the lower-cased status reported by a task result, if any."""
+        if isinstance(result, dict):
+            status = result.get("status")
+        else:
+            status = getattr(result, "status", None)
+        return str(status).lower() if status is not None else None
+    
+    @classmethod
+    def _is_terminal(cls, result: Any) -> bool:
+        """Return True if a task result reports a final (non-running) status."""
+        return cls._status_of(result) in _TERMINAL_STATUSES
+    
+    @classmethod
+    def _succeeded(cls, response: Any) -> bool:
+        """
+        Return True if every task result in a response that reports a status succeeded.
+        
+        ``run_tasks_until_done`` returns a list of task results even for a
+        single task, so every element of a list is checked. Results that are
+        still queued or in progress when it times out are not successes.
+        """
+        results = response if isinstance(response, (list, tuple)) else (response,)
+        return all(
+            cls._status_of(result) in (None, "success") for result in results
+        )
     
     def _log_status(self, message: str, status: str = "info"):
         """Log a status message with optional color formatting."""
         if not self.verbose:
             return
             
-        color_map = {
-            "info": Fore.CYAN if COLORAMA_AVAILABLE else "",
-            "success": Fore.GREEN if COLORAMA_AVAILABLE else "",
-            "warning": Fore.YELLOW if COLORAMA_AVAILABLE else "",
-            "error": Fore.RED if COLORAMA_AVAILABLE else "",
-            "progress": Fore.BLUE if COLORAMA_AVAILABLE else "",
-        }
-        
-        color = color_map.get(status, "")
-        reset = Style.RESET_ALL if COLORAMA_AVAILABLE else ""
-        
-        timestamp = time.strftime("%H:%M:%S")
-        print(f"{color}[{timestamp}] {message}{reset}", file=sys.stderr)
-        sys.stderr.flush()
+        print(
+            f"{_STATUS_COLORS.get(status, '')}[{_timestamp()}] {message}{_RESET}",
+            file=sys.stderr,
+            flush=True,
+        )
     
     def run_task(self, task_data: Dict[str, Any]) -> Any:
         """
@@ -110,6 +425,10 @@ class EdisonPlatformClient:
         Returns:
             The task response with results.
         
+        Raises:
+            TypeError: If ``task_data`` has no valid ``name``; checked before
+                anything is sent to the API.
+        
         Example:
             >>> client = EdisonPlatformClient(api_key="your_key")
             >>> task = {
@@ -118,14 +437,14 @@ class EdisonPlatformClient:
             ... }
             >>> response = client.run_task(task)
         """
-        job_name = task_data.get('name', 'Unknown')
+        job_name = self._job_name(task_data)
         query = task_data.get('query', 'N/A')
         
         self._log_status(f"Starting {job_name} task...", "info")
-        if query != 'N/A':
-            self._log_status(f"Query: {query[:100]}{'...' if len(query) > 100 else ''}", "info")
+        if self.verbose and query != 'N/A':
+            self._log_status(f"Query: {_truncate(query)}", "info")
         
-        self.logger.info(f"Running task: {job_name}")
+        self.logger.info("Running task: %s", job_name)
         
         try:
             # Create a progress indicator
@@ -153,13 +472,148 @@ class EdisonPlatformClient:
             return response
         except Exception as e:
             self._log_status(f"Error running task: {str(e)}", "error")
-            self.logger.error(f"Error running task: {str(e)}")
+            self.logger.error("Error running task: %s", e)
+            raise
+    
+    def run_task_streaming(
+        self,
+        task_data: Dict[str, Any],
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 8.0,
+        timeout: Optional[float] = _DEFAULT_TIMEOUT,
+    ) -> Iterator[Any]:
+        """
+        Run a task and yield its progress instead of blocking until completion.
+        
+        The task is submitted, then polled with a lightweight status request.
+        Each time the status changes the status response is yielded, and the
+        full task response is yielded last once the task finishes. The delay
+        between polls doubles from ``poll_interval`` up to ``max_poll_interval``.
+        
+        As with ``run_task``, waiting stops after ``timeout`` seconds: a warning
+        is logged and the task response is yielded in its unfinished state.
+        
+        Args:
+            task_data (dict): Task request data, as for ``run_task``.
+            poll_interval (float): Initial delay between status polls in seconds (default: 0.5)
+            max_poll_interval (float): Upper bound for the poll delay in seconds (default: 8.0)
+            timeout (float, optional): Seconds to wait for the task to finish, or
+                None to wait indefinitely (default: 2400)
+        
+        Yields:
+            Status responses as the task progresses, then the final task response.
+        
+        Example:
+            >>> client = EdisonPlatformClient(api_key="your_key")
+            >>> for update in client.run_task_streaming(task):
+            ...     print(update.status)
+        """
+        task_id = self.create_task(task_data)
+        delay = poll_interval
+        last_status = None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        
+        try:
+            while True:
+                update = self.client.get_task(task_id, lite=True)
+                status = self._status_of(update)
+                if self._is_terminal(update):
+                    color = "success" if status == "success" else "error"
+                    self._log_status(f"Task {task_id} finished: {status}", color)
+                    break
+                if status != last_status:
+                    self._log_status(f"Task {task_id}: {status}", "progress")
+                    last_status = status
+                    yield update
+                if deadline is not None and time.monotonic() >= deadline:
+                    self._log_status(f"Task {task_id} still {status} after {timeout}s, giving up", "warning")
+                    self.logger.warning("Timed out waiting for task %s after %s seconds", task_id, timeout)
+                    break
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+            
+            yield self.get_task(task_id)
+        except Exception as e:
+            self._log_status(f"Error streaming task: {str(e)}", "error")
+            self.logger.error("Error streaming task: %s", e)
+            raise
+    
+    def run_tasks(self, tasks: Iterable[Dict[str, Any]]) -> List[Any]:
+        """
+        Run several tasks synchronously and wait for all of them to finish.
+        
+        Every task is submitted up front and the underlying client polls them
+        together in a single loop, so N tasks share one thread instead of
+        waiting on each other in turn.
+        
+        Args:
+            tasks (iterable of dict): Task request data, as for ``run_task``.
+        
+        Returns:
+            list: Task responses in the same order as ``tasks``.
+        
+        Example:
+            >>> client = EdisonPlatformClient(api_key="your_key")
+            >>> responses = client.run_tasks([
+            ...     {"name": JobNames.LITERATURE, "query": "What causes ALS?"},
+            ...     {"name": JobNames.PRECEDENT, "query": "Has anyone cured ALS?"},
+            ... ])
+        """
+        tasks = list(tasks)
+        for task_data in tasks:
+            self._job_name(task_data)
+        self._log_status(f"Submitting {len(tasks)} tasks, waiting for completion...", "progress")
+        self.logger.info("Running %s tasks", len(tasks))
+        try:
+            responses = self.client.run_tasks_until_done(tasks)
+            self._log_status(f"{len(tasks)} tasks completed", "success")
+            self.logger.info("Tasks completed successfully")
+            return responses
+        except Exception as e:
+            self._log_status(f"Error running tasks: {str(e)}", "error")
+            self.logger.error("Error running tasks: %s", e)
             raise
     
+    def iter_tasks(
+        self, tasks: Iterable[Dict[str, Any]], max_workers: int = 8
+    ) -> Iterator[Any]:
+        """
+        Run several tasks on a thread pool, yielding each result as soon as it finishes.
+        
+        The sync counterpart of ``arun_tasks``: results come back in completion
+        order, and the workers share this client's pooled connections. Tasks
+        not yet started when the caller stops iterating are cancelled.
+        
+        Args:
+            tasks (iterable of dict): Task request data, as for ``run_task``.
+            max_workers (int): Maximum number of tasks running at once (default: 8)
+        
+        Yields:
+            Each task response as it completes.
+        
+        Example:
+            >>> client = EdisonPlatformClient(api_key="your_key")
+            >>> for response in client.iter_tasks(task_list):
+            ...     print(response)
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.run_task, task_data) for task_data in tasks]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+    
     async def arun_task(self, task_data: Dict[str, Any]) -> Any:
         """
         Run a task asynchronously until completion.
         
+        Concurrent calls with an identical ``task_data`` share one request:
+        later callers wait on the task already in flight instead of
+        submitting a duplicate. The task is only cancelled once every
+        caller waiting on it has been cancelled.
+        
         Args:
             task_data (dict): Task request data containing at minimum:
                 - name: The job type (from JobNames enum)
@@ -176,15 +630,84 @@ class EdisonPlatformClient:
             ... }
             >>> response = await client.arun_task(task)
         """
-        self.logger.info(f"Running async task: {task_data.get('name', 'Unknown')}")
+        job_name = self._job_name(task_data)
+        key = json.dumps(task_data, sort_keys=True, default=str)
+        entry = self._inflight.get(key)
+        if entry is None or entry[0].get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._arun_task(task_data, job_name))
+            entry = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda done: self._forget_inflight(key, done))
+        else:
+            self.logger.info("Joining in-flight async task: %s", job_name)
+        
+        task = entry[0]
+        entry[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                task.cancel()
+    
+    def _forget_inflight(self, key: str, task: "asyncio.Future") -> None:
+        """Drop the in-flight entry for ``key`` if it still belongs to ``task``."""
+        # A newer call may have registered its own task under the same key
+        # before this callback ran; that entry must stay
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is task:
+            del self._inflight[key]
+    
+    async def _arun_task(self, task_data: Dict[str, Any], job_name: str) -> Any:
+        self.logger.info("Running async task: %s", job_name)
         try:
             response = await self.client.arun_tasks_until_done(task_data)
             self.logger.info("Async task completed successfully")
             return response
         except Exception as e:
-            self.logger.error(f"Error running async task: {str(e)}")
+            self.logger.error("Error running async task: %s", e)
             raise
     
+    async def arun_tasks(
+        self, tasks: Iterable[Dict[str, Any]], concurrency: int = 8
+    ) -> AsyncIterator[Any]:
+        """
+        Run several tasks concurrently, yielding each result as soon as it finishes.
+        
+        Results are yielded in completion order, not submission order, and at
+        most ``concurrency`` tasks are in flight at any time. Tasks still
+        pending when the caller stops iterating are cancelled.
+        
+        Args:
+            tasks (iterable of dict): Task request data, as for ``arun_task``.
+            concurrency (int): Maximum number of tasks running at once (default: 8)
+        
+        Yields:
+            Each task response as it completes.
+        
+        Example:
+            >>> client = EdisonPlatformClient(api_key="your_key")
+            >>> async for response in client.arun_tasks(task_list):
+            ...     print(response)
+        """
+        tasks = list(tasks)
+        if len(tasks) == 1:
+            yield await self.arun_task(tasks[0])
+            return
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _run_one(task_data: Dict[str, Any]) -> Any:
+            async with semaphore:
+                return await self.arun_task(task_data)
+        
+        pending = [asyncio.ensure_future(_run_one(task_data)) for task_data in tasks]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for future in pending:
+                future.cancel()
+    
     def create_task(self, task_data: Dict[str, Any]) -> str:
         """
         Create and submit a task, returning the task ID.
@@ -203,13 +726,14 @@ class EdisonPlatformClient:
             ... }
             >>> task_id = client.create_task(task)
         """
-        self.logger.info(f"Creating task: {task_data.get('name', 'Unknown')}")
+        job_name = self._job_name(task_data)
+        self.logger.info("Creating task: %s", job_name)
         try:
             task_id = self.client.create_task(task_data)
-            self.logger.info(f"Task created with ID: {task_id}")
+            self.logger.info("Task created with ID: %s", task_id)
             return task_id
         except Exception as e:
-            self.logger.error(f"Error creating task: {str(e)}")
+            self.logger.error("Error creating task: %s", e)
             raise
     
     async def acreate_task(self, task_data: Dict[str, Any]) -> str:
@@ -230,19 +754,23 @@ class EdisonPlatformClient:
             ... }
             >>> task_id = await client.acreate_task(task)
         """
-        self.logger.info(f"Creating async task: {task_data.get('name', 'Unknown')}")
+        job_name = self._job_name(task_data)
+        self.logger.info("Creating async task: %s", job_name)
         try:
             task_id = await self.client.acreate_task(task_data)
-            self.logger.info(f"Async task created with ID: {task_id}")
+            self.logger.info("Async task created with ID: %s", task_id)
             return task_id
         except Exception as e:
-            self.logger.error(f"Error creating async task: {str(e)}")
+            self.logger.error("Error creating async task: %s", e)
             raise
     
     def get_task(self, task_id: str) -> Any:
         """
         Retrieve the status and results of a task by its ID.
         
+        Results for tasks that have finished are cached, so polling a
+        completed task again does not hit the API.
+        
         Args:
             task_id (str): The ID of the task to retrieve.
         
@@ -254,19 +782,27 @@ class EdisonPlatformClient:
             >>> task_id = "some_task_id"
             >>> result = client.get_task(task_id)
         """
-        self.logger.info(f"Retrieving task: {task_id}")
+        cached = self._task_cache.get(task_id)
+        if cached is not None:
+            return cached
+        
+        self.logger.info("Retrieving task: %s", task_id)
         try:
             result = self.client.get_task(task_id)
-            self.logger.info(f"Task retrieved: {task_id}")
+            self.logger.info("Task retrieved: %s", task_id)
+            if self._is_terminal(result):
+                self._task_cache.set(task_id, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error retrieving task {task_id}: {str(e)}")
+            self.logger.error("Error retrieving task %s: %s", task_id, e)
             raise
     
     async def aget_task(self, task_id: str) -> Any:
         """
         Retrieve the status and results of a task by its ID asynchronously.
         
+        Shares the finished-task cache with ``get_task``.
+        
         Args:
             task_id (str): The ID of the task to retrieve.
         
@@ -278,21 +814,56 @@ class EdisonPlatformClient:
             >>> task_id = "some_task_id"
             >>> result = await client.aget_task(task_id)
         """
-        self.logger.info(f"Retrieving async task: {task_id}")
+        cached = self._task_cache.get(task_id)
+        if cached is not None:
+            return cached
+        
+        self.logger.info("Retrieving async task: %s", task_id)
         try:
             result = await self.client.aget_task(task_id)
-            self.logger.info(f"Async task retrieved: {task_id}")
+            self.logger.info("Async task retrieved: %s", task_id)
+            if self._is_terminal(result):
+                self._task_cache.set(task_id, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error retrieving async task {task_id}: {str(e)}")
+            self.logger.error("Error retrieving async task %s: %s", task_id, e)
             raise
     
-    def literature_search(self, query: str) -> Any:
+    def invalidate_task(self, task_id: str) -> None:
+        """
+        Drop a finished task from the local cache so the next lookup refetches it.
+        
+        Args:
+            task_id (str): The ID of the task to forget.
+        """
+        self._task_cache.pop(task_id)
+    
+    def _run_cached(self, task_data: Dict[str, Any], use_cache: bool) -> Any:
+        """Run a query task, consulting the per-client query cache if enabled."""
+        if not use_cache:
+            return self.run_task(task_data)
+        
+        key = (str(task_data["name"]), task_data["query"])
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._log_status("Using cached result for identical query", "success")
+            return cached
+        
+        response = self.run_task(task_data)
+        # Only successful runs are cached; a failed or unfinished one is retried
+        if self._succeeded(response):
+            self._query_cache.set(key, response)
+        return response
+    
+    def literature_search(self, query: str, use_cache: bool = False) -> Any:
         """
         Convenience method for literature search tasks.
         
         Args:
             query (str): The scientific question to research.
+            use_cache (bool): Reuse the result of an identical query made by
+                this client within the last hour, if that run succeeded
+                (default: False)
         
         Returns:
             Task response with literature search results.
@@ -304,24 +875,21 @@ class EdisonPlatformClient:
             ... )
         """
         if self.verbose:
-            self._log_status("=" * 60, "info")
-            self._log_status("LITERATURE SEARCH", "info")
-            self._log_status("=" * 60, "info")
+            self._log_status(f"{_BANNER}\nLITERATURE SEARCH\n{_BANNER}", "info")
             self._log_status(f"Researching: {query}", "info")
             self._log_status("This may take several minutes as Kosmos reads papers and analyzes data...", "progress")
         
-        task_data = {
-            "name": JobNames.LITERATURE,
-            "query": query
-        }
-        return self.run_task(task_data)
+        return self._run_cached({"name": _LITERATURE, "query": query}, use_cache)
     
-    def precedent_search(self, query: str) -> Any:
+    def precedent_search(self, query: str, use_cache: bool = False) -> Any:
         """
         Convenience method for precedent search tasks.
         
         Args:
             query (str): The query about prior scientific work.
+            use_cache (bool): Reuse the result of an identical query made by
+                this client within the last hour, if that run succeeded
+                (default: False)
         
         Returns:
             Task response with precedent search results.
@@ -333,16 +901,10 @@ class EdisonPlatformClient:
             ... )
         """
         if self.verbose:
-            self._log_status("=" * 60, "info")
-            self._log_status("PRECEDENT SEARCH", "info")
-            self._log_status("=" * 60, "info")
+            self._log_status(f"{_BANNER}\nPRECEDENT SEARCH\n{_BANNER}", "info")
             self._log_status(f"Searching for: {query}", "info")
         
-        task_data = {
-            "name": JobNames.PRECEDENT,
-            "query": query
-        }
-        return self.run_task(task_data)
+        return self._run_cached({"name": _PRECEDENT, "query": query}, use_cache)
     
     def analyze_data(self, dataset: Optional[str] = None, **kwargs) -> Any:
         """
@@ -366,12 +928,10 @@ class EdisonPlatformClient:
         task_overrides = params_for_prompt.pop("task_overrides", None) or {}
         
         if self.verbose:
-            self._log_status("=" * 60, "info")
-            self._log_status("DATA ANALYSIS", "info")
-            self._log_status("=" * 60, "info")
-            self._log_status(f"Analyzing dataset: {dataset}", "info")
+            lines = [_BANNER, "DATA ANALYSIS", _BANNER, f"Analyzing dataset: {dataset}"]
             if params_for_prompt:
-                self._log_status(f"Parameters: {params_for_prompt}", "info")
+                lines.append(f"Parameters: {params_for_prompt}")
+            self._log_status("\n".join(lines), "info")
         
         if custom_query:
             query = custom_query
@@ -380,13 +940,7 @@ class EdisonPlatformClient:
             if dataset:
                 parts.append(f"Dataset: {dataset}")
             if params_for_prompt:
-                parts.append("Parameters:")
-                for key, value in params_for_prompt.items():
-                    if isinstance(value, (dict, list)):
-                        value_str = json.dumps(value, indent=2, sort_keys=True)
-                    else:
-                        value_str = str(value)
-                    parts.append(f"- {key}: {value_str}")
+                parts.extend(_format_parameters(params_for_prompt))
             query = "\n".join(parts).strip()
         
         if not query:
@@ -394,10 +948,7 @@ class EdisonPlatformClient:
                 "Analysis requests require at least a dataset or a query string."
             )
         
-        task_data = {
-            "name": JobNames.ANALYSIS,
-            "query": query
-        }
+        task_data = {"name": _ANALYSIS, "query": query}
         
         if task_overrides:
             task_data.update(task_overrides)
@@ -424,28 +975,16 @@ class EdisonPlatformClient:
         task_overrides = params_for_prompt.pop("task_overrides", None) or {}
         
         if self.verbose:
-            self._log_status("=" * 60, "info")
-            self._log_status("CHEMISTRY TASK", "info")
-            self._log_status("=" * 60, "info")
-            self._log_status(f"Task: {query}", "info")
+            lines = [_BANNER, "CHEMISTRY TASK", _BANNER, f"Task: {query}"]
             if params_for_prompt:
-                self._log_status(f"Parameters: {params_for_prompt}", "info")
+                lines.append(f"Parameters: {params_for_prompt}")
+            self._log_status("\n".join(lines), "info")
         
         prompt = query.strip()
         if params_for_prompt:
-            extra_lines = ["Parameters:"]
-            for key, value in params_for_prompt.items():
-                if isinstance(value, (dict, list)):
-                    value_str = json.dumps(value, indent=2, sort_keys=True)
-                else:
-                    value_str = str(value)
-                extra_lines.append(f"- {key}: {value_str}")
-            prompt = f"{prompt}\n\n" + "\n".join(extra_lines)
-        
-        task_data = {
-            "name": JobNames.MOLECULES,
-            "query": prompt
-        }
+            prompt = f"{prompt}\n\n" + "\n".join(_format_parameters(params_for_prompt))
+        
+        task_data = {"name": _MOLECULES, "query": prompt}
         if task_overrides:
             task_data.update(task_overrides)
         return self.run_task(task_data)
@@ -0,0 +1,31 @@
+"""
+Environment loading for the Edison Platform scripts and examples.
+"""
+
+import functools
+
+from dotenv import find_dotenv, load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_env_loaded() -> bool:
+    """
+    Load variables from the nearest ``.env`` file, at most once per process.
+    
+    The file is searched for from the current working directory upwards, as
+    ``load_dotenv`` would from a script in that directory; searching from the
+    caller's location would start inside this package instead. The lookup
+    and parse only happen on the first call, so scripts that import one
+    another, or are collected together by pytest, pay for it once. Variables
+    already set in the environment are never overridden.
+    
+    Returns:
+        bool: True if a ``.env`` file was found and loaded.
+    
+    Example:
+        >>> from edison_platform import EdisonPlatformClient, ensure_env_loaded
+        >>> ensure_env_loaded()
+        True
+        >>> client = EdisonPlatformClient()
+    """
+    return load_dotenv(find_dotenv(usecwd=True))
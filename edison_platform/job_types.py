@@ -3,6 +3,7 @@ Job types available in the Edison Scientific platform.
 """
 
 from enum import Enum
+from types import MappingProxyType
 
 
 class JobTypes(Enum):
@@ -23,10 +24,16 @@ class JobTypes(Enum):
     @classmethod
     def get_description(cls, job_type):
         """Get a description for a specific job type."""
-        descriptions = {
-            cls.LITERATURE: "Search and generate answers based on scientific literature",
-            cls.ANALYSIS: "Analyze biological datasets",
-            cls.PRECEDENT: "Query prior scientific work",
-            cls.MOLECULES: "Chemistry tasks, leveraging cheminformatics tools"
-        }
-        return descriptions.get(job_type, "Unknown job type")
+        return _DESCRIPTIONS.get(job_type, "Unknown job type")
+
+
+# Built once at import; a dict in the Enum body would become a member
+_DESCRIPTIONS = MappingProxyType({
+    JobTypes.LITERATURE: "Search and generate answers based on scientific literature",
+    JobTypes.ANALYSIS: "Analyze biological datasets",
+    JobTypes.PRECEDENT: "Query prior scientific work",
+    JobTypes.MOLECULES: "Chemistry tasks, leveraging cheminformatics tools",
+})
+
+# Read-only string -> member lookup, e.g. JOBTYPE_BY_VALUE["LITERATURE"]
+JOBTYPE_BY_VALUE = MappingProxyType({job_type.value: job_type for job_type in JobTypes})
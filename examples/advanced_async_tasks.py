@@ -1,71 +1,89 @@
 """
-Advanced example demonstrating asynchronous task creation and retrieval.
+Advanced example demonstrating asynchronous task execution.
 
 This example shows how to:
-1. Create tasks asynchronously
-2. Retrieve task status and results later
-3. Handle multiple tasks concurrently
+1. Run a task asynchronously until it completes
+2. Handle multiple tasks concurrently
 """
 
 import asyncio
 import os
-from dotenv import load_dotenv
+import sys
 from edison_client import JobNames
-from edison_platform import EdisonPlatformClient
+from edison_platform import EdisonPlatformClient, ensure_env_loaded
 
 # Load environment variables
-load_dotenv()
+ensure_env_loaded()
+
+# Maximum number of tasks sent to Edison at once
+MAX_CONCURRENCY = int(os.getenv("EDISON_MAX_CONCURRENCY", "8"))
+
+SEP = "-" * 80
+
+
+async def run_and_release(semaphore, client, task_data):
+    """Run one task, then free the concurrency slot it was started in."""
+    try:
+        return await client.arun_task(task_data)
+    finally:
+        semaphore.release()
+
+
+async def run_all(client, tasks):
+    """Run tasks concurrently, returning their results in submission order."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    handles = []
+    # A slot is acquired before each task is created, so a long task list
+    # never has more than MAX_CONCURRENCY tasks (or calls) alive at once
+    if sys.version_info >= (3, 11):
+        # A TaskGroup cancels the remaining tasks as soon as one fails
+        async with asyncio.TaskGroup() as group:
+            for task in tasks:
+                await semaphore.acquire()
+                handles.append(group.create_task(run_and_release(semaphore, client, task)))
+        return [handle.result() for handle in handles]
+    for task in tasks:
+        await semaphore.acquire()
+        handles.append(asyncio.ensure_future(run_and_release(semaphore, client, task)))
+    return await asyncio.gather(*handles)
 
 
 async def main():
     """Run advanced async examples."""
     
-    # Initialize the client
-    client = EdisonPlatformClient()
-    
-    # Example 1: Create a task and poll for results
-    print("Example 1: Create and retrieve task")
-    print("-" * 80)
-    
-    task_data = {
-        "name": JobNames.PRECEDENT,
-        "query": "Has anyone used CRISPR to cure sickle cell anemia?"
-    }
-    
-    # Create the task
-    task_id = await client.acreate_task(task_data)
-    print(f"Task created with ID: {task_id}")
-    
-    # Retrieve the task result
-    # In a real scenario, you might poll this or wait before retrieving
-    result = await client.aget_task(task_id)
-    print(f"Task result: {result}")
-    print("-" * 80)
-    
-    # Example 2: Run multiple tasks concurrently
-    print("\nExample 2: Run multiple tasks concurrently")
-    print("-" * 80)
-    
-    tasks = [
-        {
-            "name": JobNames.LITERATURE,
-            "query": "What are the mechanisms of drug resistance in cancer?"
-        },
-        {
+    # Initialize the client once and reuse it for every task
+    async with EdisonPlatformClient() as client:
+        # Example 1: Run a task and wait for its result in one call
+        print(f"Example 1: Run a task until it completes\n{SEP}")
+        
+        task_data = {
             "name": JobNames.PRECEDENT,
-            "query": "What are recent breakthroughs in Alzheimer's disease treatment?"
+            "query": "Has anyone used CRISPR to cure sickle cell anemia?"
         }
-    ]
-    
-    # Run all tasks concurrently
-    results = await asyncio.gather(
-        *[client.arun_task(task) for task in tasks]
-    )
-    
-    for i, result in enumerate(results, 1):
-        print(f"\nTask {i} result:")
-        print(result)
-        print("-" * 40)
+        
+        # arun_task submits the task and waits for it in one step
+        result = await client.arun_task(task_data)
+        print(f"Task result: {result}\n{SEP}")
+        
+        # Example 2: Run multiple tasks concurrently
+        print(f"\nExample 2: Run multiple tasks concurrently\n{SEP}")
+        
+        tasks = [
+            {
+                "name": JobNames.LITERATURE,
+                "query": "What are the mechanisms of drug resistance in cancer?"
+            },
+            {
+                "name": JobNames.PRECEDENT,
+                "query": "What are recent breakthroughs in Alzheimer's disease treatment?"
+            }
+        ]
+        
+        # Run the tasks concurrently, at most MAX_CONCURRENCY at a time
+        results = await run_all(client, tasks)
+        
+        for i, result in enumerate(results, 1):
+            print(f"\nTask {i} result:\n{result}\n{'-' * 40}")
 
 
 if __name__ == "__main__":
@@ -11,17 +11,25 @@ https://edisonscientific.com/articles/announcing-kosmos
 from __future__ import annotations
 
 import argparse
+import asyncio
+import io
 import json
 import textwrap
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-from dotenv import load_dotenv
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
 
-from edison_platform import EdisonPlatformClient
+from edison_platform import EdisonPlatformClient, ensure_env_loaded
 from edison_platform.job_types import JobTypes
 
 
-HIGHLIGHTS: List[str] = [
+SEP = "-" * 80
+BIGSEP = "=" * 80
+
+_RAW_HIGHLIGHTS = [
     (
         "Structured world models let Kosmos stitch together hundreds of agent "
         "trajectories, keep tens of millions of tokens in scope, and audit every "
@@ -39,8 +47,16 @@ HIGHLIGHTS: List[str] = [
     ),
 ]
 
+# The narration text is static, so it is wrapped once at import
+HIGHLIGHTS: List[str] = [
+    f"- {textwrap.fill(bullet, width=78, subsequent_indent='  ')}"
+    for bullet in _RAW_HIGHLIGHTS
+]
+
 
 Scene = Dict[str, Any]
+# A client convenience method, bound once per run
+SceneMethod = Callable[..., Any]
 
 SCENES: List[Scene] = [
     {
@@ -150,44 +166,89 @@ def parse_args() -> argparse.Namespace:
 
 def format_json(data: Any) -> str:
     """Render responses in a readable JSON block when possible."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            # orjson rejects some values json handles, e.g. ints wider than 64 bits
+            pass
     try:
         return json.dumps(data, indent=2, default=str)
-    except TypeError:
+    except (TypeError, ValueError):
         return str(data)
 
 
+# Scene narration never changes between runs, so it is wrapped and
+# serialized once at import
+for _scene in SCENES:
+    _scene["insight_wrapped"] = textwrap.fill(_scene["insight"], width=80)
+    _scene["_kwargs_json"] = format_json(_scene["kwargs"])
+del _scene
+
+SCENES_BY_ID: Dict[str, Scene] = {scene["id"].lower(): scene for scene in SCENES}
+
+
 def iter_scenes(selected_ids: Iterable[str] | None) -> Iterable[Scene]:
+    """Return the selected scenes in the order given, each at most once."""
     if not selected_ids:
         return SCENES
-    allowed = {scene_id.lower() for scene_id in selected_ids}
-    return [scene for scene in SCENES if scene["id"].lower() in allowed]
+    wanted = dict.fromkeys(scene_id.lower() for scene_id in selected_ids)
+    return [SCENES_BY_ID[scene_id] for scene_id in wanted if scene_id in SCENES_BY_ID]
 
 
 def print_header() -> None:
-    print("\nEdison Platform x Kosmos Showcase")
-    print("=" * 80)
-    for bullet in HIGHLIGHTS:
-        print(f"- {textwrap.fill(bullet, width=78, subsequent_indent='  ')}")
-    print("=" * 80)
-
-
-def run_scene(scene: Scene, client: EdisonPlatformClient | None, dry_run: bool) -> None:
-    print(f"\n[{scene['id']}] {scene['title']}")
-    print("-" * 80)
-    print(textwrap.fill(scene["insight"], width=80))
-    print("\nJob type:", scene["job_type"].name)
-    print("Payload:")
-    print(format_json(scene["kwargs"]))
-
-    if dry_run or client is None:
+    print("\n".join(["\nEdison Platform x Kosmos Showcase", BIGSEP, *HIGHLIGHTS, BIGSEP]))
+
+
+def print_scene_intro(scene: Scene, file: Any = None) -> None:
+    print(
+        "\n".join((
+            f"\n[{scene['id']}] {scene['title']}",
+            SEP,
+            scene["insight_wrapped"],
+            f"\nJob type: {scene['job_type'].name}",
+            "Payload:",
+            scene["_kwargs_json"],
+        )),
+        file=file,
+    )
+
+
+def run_scene(scene: Scene, method: SceneMethod | None = None) -> None:
+    print_scene_intro(scene)
+
+    if method is None:
         print("\nDry-run mode: skipping live Edison API call.")
         return
 
-    method = getattr(client, scene["method"])
     print("\nRunning on Edison...")
     response = method(**scene["kwargs"])
-    print("\nResponse:")
-    print(format_json(response))
+    print(f"\nResponse:\n{format_json(response)}")
+
+
+async def arun_scene(scene: Scene, method: SceneMethod) -> str:
+    """Run one scene in a worker thread and return its full narration."""
+    buffer = io.StringIO()
+    print_scene_intro(scene, file=buffer)
+    try:
+        response = await asyncio.to_thread(method, **scene["kwargs"])
+    except Exception as exc:  # keep the other scenes' results
+        print(f"\nScene failed: {exc}", file=buffer)
+    else:
+        print(f"\nResponse:\n{format_json(response)}", file=buffer)
+    return buffer.getvalue()
+
+
+async def run_scenes_concurrently(scenes: List[Tuple[Scene, SceneMethod]]) -> None:
+    """Run every scene at once, then print each narration in scene order."""
+    print(f"\nRunning {len(scenes)} scene(s) on Edison concurrently...")
+    narrations = await asyncio.gather(*(arun_scene(scene, method) for scene, method in scenes))
+    for narration in narrations:
+        print(narration, end="")
 
 
 def list_available_scenes() -> None:
@@ -207,7 +268,7 @@ def main() -> None:
     if args.scenes and not selected_scenes:
         raise SystemExit("No scenes matched the provided IDs.")
 
-    load_dotenv()
+    ensure_env_loaded()
 
     client: EdisonPlatformClient | None = None
     if not args.dry_run:
@@ -219,8 +280,13 @@ def main() -> None:
             ) from exc
 
     print_header()
-    for scene in selected_scenes:
-        run_scene(scene, client, dry_run=args.dry_run)
+    if client is None:
+        for scene in selected_scenes:
+            run_scene(scene)
+    else:
+        # Resolve each scene's client method once, up front
+        bound_scenes = [(scene, getattr(client, scene["method"])) for scene in selected_scenes]
+        asyncio.run(run_scenes_concurrently(bound_scenes))
 
     print("\nDemo complete. Invite your audience to try their own scene next!")
 
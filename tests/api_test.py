@@ -9,7 +9,8 @@ Usage:
     python tests/api_test.py
 
 Requirements:
-    - requests library: pip install requests
+    - httpx library: pip install "httpx[http2]" (HTTP/2 needs the http2 extra)
+    - tenacity library: pip install tenacity (installed with edison-client)
     - python-dotenv library: pip install python-dotenv
     - .env file with API_KEY and API_BASE_URL configured
 
@@ -20,26 +21,71 @@ Environment Variables:
     API_VERIFY_SSL: Verify SSL certificates (optional, default: true)
 """
 
+import asyncio
+import importlib.util
+import json
 import os
 import sys
-from dotenv import load_dotenv
 
-# Try to import requests, provide helpful error if not installed
 try:
-    import requests
+    from edison_platform.env import ensure_env_loaded
+except ImportError:  # running without the package installed
+    from dotenv import load_dotenv as ensure_env_loaded
+
+# Try to import httpx, provide helpful error if not installed
+try:
+    import httpx
 except ImportError:
-    print("Error: 'requests' library not found")
-    print("Install it with: pip install requests")
+    print("Error: 'httpx' library not found")
+    print("Install it with: pip install \"httpx[http2]\"")
     sys.exit(1)
 
+# tenacity is installed alongside edison-client
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
+
+# With the http2 extra the requests are multiplexed over one connection;
+# without it httpx falls back to pooled HTTP/1.1 connections
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Transport-level failures reported as a failed test rather than a crash
+REQUEST_ERRORS = (httpx.HTTPError,)
+
+
+def _is_server_error(outcome):
+    """True for a fetched (response, body) pair with a 5xx status"""
+    response, _ = outcome
+    return response.status_code >= 500
+
+
+# Connection errors, timeouts and 5xx responses are retried with jittered
+# backoff; 4xx responses are deterministic and returned straight away. Once
+# attempts run out the last response is returned, or its error re-raised.
+retry_transient = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.2, max=2.0) + wait_random(0, 0.2),
+    retry=retry_if_exception_type(httpx.TransportError) | retry_if_result(_is_server_error),
+    retry_error_callback=lambda state: state.outcome.result(),
+)
+
 
 class APITester:
     """API testing class for Edison Platform"""
     
+    HEALTH_ENDPOINT = "/health"
+    AUTH_ENDPOINT = "/user"
+    RESOURCES_ENDPOINT = "/resources"
+    
     def __init__(self):
         """Initialize the API tester with configuration from .env"""
         # Load environment variables from .env file
-        load_dotenv()
+        ensure_env_loaded()
         
         # Get required configuration
         self.api_key = os.getenv('API_KEY')
@@ -95,27 +141,36 @@ class APITester:
             'User-Agent': 'EdisonPlatform-TestSuite/1.0'
         }
     
-    def test_health_check(self):
+    @retry_transient
+    async def fetch(self, client, endpoint):
+        """GET an endpoint, returning the response and its raw body"""
+        response = await client.get(endpoint)
+        return response, response.content
+    
+    @staticmethod
+    def _unwrap(outcome):
+        """Return a fetched (response, body) pair, re-raising a failed request"""
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+    
+    def test_health_check(self, outcome):
         """Test 1: Health check endpoint"""
         test_name = "Health Check"
-        endpoint = "/health"
+        endpoint = self.HEALTH_ENDPOINT
         
         print(f"\nTest 1: {test_name}")
         print(f"  Endpoint: GET {endpoint}")
         
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
+            response, body = self._unwrap(outcome)
             
-            print(f"  Status: {response.status_code} {response.reason}")
+            print(f"  Status: {response.status_code} {response.reason_phrase}")
             
             # Check if request was successful
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json.loads(body)
                     if self.verbose:
                         print(f"  Response: {data}")
                     print("  PASSED")
@@ -135,35 +190,30 @@ class APITester:
                 self.test_results.append((test_name, "FAILED", error_msg))
                 return False
                 
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             error_msg = f"Request failed: {str(e)}"
             print(f"  FAILED: {error_msg}")
             self.tests_failed += 1
             self.test_results.append((test_name, "FAILED", error_msg))
             return False
     
-    def test_authentication(self):
+    def test_authentication(self, outcome):
         """Test 2: Authentication with API key"""
         test_name = "Authentication Test"
-        endpoint = "/user"
+        endpoint = self.AUTH_ENDPOINT
         
         print(f"\nTest 2: {test_name}")
         print(f"  Endpoint: GET {endpoint}")
         
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=self.get_headers(),
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
+            response, body = self._unwrap(outcome)
             
-            print(f"  Status: {response.status_code} {response.reason}")
+            print(f"  Status: {response.status_code} {response.reason_phrase}")
             
             # Check if authentication was successful
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json.loads(body)
                     if self.verbose:
                         print(f"  Authenticated user: {data.get('email', 'N/A')}")
                     print(f"  Authenticated successfully")
@@ -190,35 +240,30 @@ class APITester:
                 self.test_results.append((test_name, "FAILED", error_msg))
                 return False
                 
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             error_msg = f"Request failed: {str(e)}"
             print(f"  FAILED: {error_msg}")
             self.tests_failed += 1
             self.test_results.append((test_name, "FAILED", error_msg))
             return False
     
-    def test_list_resources(self):
+    def test_list_resources(self, outcome):
         """Test 3: List resources endpoint"""
         test_name = "List Resources"
-        endpoint = "/resources"
+        endpoint = self.RESOURCES_ENDPOINT
         
         print(f"\nTest 3: {test_name}")
         print(f"  Endpoint: GET {endpoint}")
         
         try:
-            response = requests.get(
-                f"{self.base_url}{endpoint}",
-                headers=self.get_headers(),
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
+            response, body = self._unwrap(outcome)
             
-            print(f"  Status: {response.status_code} {response.reason}")
+            print(f"  Status: {response.status_code} {response.reason_phrase}")
             
             # Check if request was successful
             if response.status_code == 200:
                 try:
-                    data = response.json()
+                    data = json.loads(body)
                     if self.verbose:
                         print(f"  Response: {data}")
                     # Check for expected response format (data field with array)
@@ -254,24 +299,39 @@ class APITester:
                 self.test_results.append((test_name, "FAILED", error_msg))
                 return False
                 
-        except requests.exceptions.RequestException as e:
+        except REQUEST_ERRORS as e:
             error_msg = f"Request failed: {str(e)}"
             print(f"  FAILED: {error_msg}")
             self.tests_failed += 1
             self.test_results.append((test_name, "FAILED", error_msg))
             return False
     
-    def run_all_tests(self):
+    async def run_all_tests(self):
         """Run all API tests"""
         if not self.validate_config():
             return False
         
         print("\nRunning API tests...\n")
         
-        # Run all tests
-        self.test_health_check()
-        self.test_authentication()
-        self.test_list_resources()
+        # The checks are independent, so send all requests at once over one
+        # pooled client, then validate the responses in order
+        endpoints = (self.HEALTH_ENDPOINT, self.AUTH_ENDPOINT, self.RESOURCES_ENDPOINT)
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.get_headers(),
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=16),
+        ) as client:
+            health, auth, resources = await asyncio.gather(
+                *(self.fetch(client, endpoint) for endpoint in endpoints),
+                return_exceptions=True
+            )
+        
+        self.test_health_check(health)
+        self.test_authentication(auth)
+        self.test_list_resources(resources)
         
         # Print summary
         self.print_summary()
@@ -299,7 +359,7 @@ class APITester:
 def main():
     """Main entry point for the test suite"""
     tester = APITester()
-    success = tester.run_all_tests()
+    success = asyncio.run(tester.run_all_tests())
     
     # Exit with appropriate code
     sys.exit(0 if success else 1)
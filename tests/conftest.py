@@ -0,0 +1,76 @@
+"""
+Shared pytest fixtures for Edison Platform tests.
+"""
+
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+# edison_platform (and edison_client behind it) is imported inside the
+# fixtures, so collecting tests does not pay for the SDK import graph
+
+
+def pytest_configure(config):
+    # Tests marked parallel share no state between them, so they can be
+    # sharded across processes with pytest-xdist: ``pytest -n auto tests``
+    config.addinivalue_line(
+        "markers", "parallel: in-memory test that is safe to run under pytest -n auto"
+    )
+
+
+@pytest.fixture(scope="session")
+def sdk():
+    """The package symbols under test, imported on first use."""
+    from edison_client import JobNames
+    from edison_platform import EdisonPlatformClient, JobTypes
+    from edison_platform.job_types import JOBTYPE_BY_VALUE
+    return SimpleNamespace(
+        EdisonPlatformClient=EdisonPlatformClient,
+        JobTypes=JobTypes,
+        JobNames=JobNames,
+        JOBTYPE_BY_VALUE=JOBTYPE_BY_VALUE,
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_lru_caches():
+    """Start and finish every test with the package's memoized helpers cleared."""
+    from edison_platform import env, job_types
+    cached = [
+        obj for obj in (env.ensure_env_loaded, job_types.JobTypes.get_description)
+        if hasattr(obj, "cache_clear")
+    ]
+    for obj in cached:
+        obj.cache_clear()
+    yield
+    for obj in cached:
+        obj.cache_clear()
+
+
+@pytest.fixture
+def edison_client_cls(monkeypatch):
+    """Replace the EdisonClient class with a mock for the duration of a test."""
+    # Built fresh each time: a copy.copy of a shared template Mock shares its
+    # child mocks, so return values set in one test would leak into the next
+    cls = Mock()
+    monkeypatch.setattr('edison_platform.client.EdisonClient', cls)
+    return cls
+
+
+@pytest.fixture
+def mock_edison(edison_client_cls):
+    """The EdisonClient instance the client under test talks to."""
+    return edison_client_cls.return_value
+
+
+@pytest.fixture(scope="session")
+def live_client():
+    """One real client shared by every live test, skipped without an API key."""
+    from edison_platform import EdisonPlatformClient, ensure_env_loaded
+    ensure_env_loaded()
+    if not os.getenv("EDISON_API_KEY"):
+        pytest.skip("EDISON_API_KEY is not set; skipping live Edison tests")
+    with EdisonPlatformClient(verbose=True, show_progress=True) as client:
+        yield client
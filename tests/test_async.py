@@ -2,9 +2,10 @@
 Async tests for Edison Platform Client.
 """
 
+import asyncio
 import pytest
 import os
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import AsyncMock
 from edison_platform import EdisonPlatformClient
 from edison_client import JobNames
 
@@ -13,15 +14,12 @@ class TestEdisonPlatformClientAsync:
     """Test async methods of EdisonPlatformClient."""
     
     @pytest.mark.asyncio
-    @patch('edison_platform.client.EdisonClient')
-    async def test_arun_task(self, mock_edison_client):
+    async def test_arun_task(self, mock_edison):
         """Test asynchronous task execution."""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.arun_tasks_until_done = AsyncMock(
+        mock_edison.arun_tasks_until_done = AsyncMock(
             return_value={"status": "completed"}
         )
-        mock_edison_client.return_value = mock_client_instance
         
         # Test
         client = EdisonPlatformClient(api_key="test_key")
@@ -30,16 +28,13 @@ class TestEdisonPlatformClientAsync:
         
         # Verify
         assert result == {"status": "completed"}
-        mock_client_instance.arun_tasks_until_done.assert_called_once_with(task_data)
+        mock_edison.arun_tasks_until_done.assert_called_once_with(task_data)
     
     @pytest.mark.asyncio
-    @patch('edison_platform.client.EdisonClient')
-    async def test_acreate_task(self, mock_edison_client):
+    async def test_acreate_task(self, mock_edison):
         """Test async task creation."""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.acreate_task = AsyncMock(return_value="async_task_123")
-        mock_edison_client.return_value = mock_client_instance
+        mock_edison.acreate_task = AsyncMock(return_value="async_task_123")
         
         # Test
         client = EdisonPlatformClient(api_key="test_key")
@@ -48,18 +43,15 @@ class TestEdisonPlatformClientAsync:
         
         # Verify
         assert task_id == "async_task_123"
-        mock_client_instance.acreate_task.assert_called_once_with(task_data)
+        mock_edison.acreate_task.assert_called_once_with(task_data)
     
     @pytest.mark.asyncio
-    @patch('edison_platform.client.EdisonClient')
-    async def test_aget_task(self, mock_edison_client):
+    async def test_aget_task(self, mock_edison):
         """Test async task retrieval."""
         # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.aget_task = AsyncMock(
+        mock_edison.aget_task = AsyncMock(
             return_value={"status": "completed", "result": "async data"}
         )
-        mock_edison_client.return_value = mock_client_instance
         
         # Test
         client = EdisonPlatformClient(api_key="test_key")
@@ -67,7 +59,90 @@ class TestEdisonPlatformClientAsync:
         
         # Verify
         assert result == {"status": "completed", "result": "async data"}
-        mock_client_instance.aget_task.assert_called_once_with("async_task_123")
+        mock_edison.aget_task.assert_called_once_with("async_task_123")
+
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_connections(self, mock_edison):
+        """Leaving the async context manager should await the client's aclose."""
+        mock_edison.aclose = AsyncMock()
+        
+        async with EdisonPlatformClient(api_key="test_key") as client:
+            assert client.client is mock_edison
+        
+        mock_edison.aclose.assert_awaited_once_with()
+    
+    @pytest.mark.asyncio
+    async def test_aget_task_caches_terminal_results(self, mock_edison):
+        """Finished tasks should not be fetched again asynchronously."""
+        mock_edison.aget_task = AsyncMock(
+            return_value={"status": "success", "result": "async data"}
+        )
+        
+        client = EdisonPlatformClient(api_key="test_key")
+        await client.aget_task("async_task_123")
+        result = await client.aget_task("async_task_123")
+        
+        assert result == {"status": "success", "result": "async data"}
+        mock_edison.aget_task.assert_called_once_with("async_task_123")
+    
+    @pytest.mark.asyncio
+    async def test_arun_tasks_yields_in_completion_order(self, mock_edison):
+        """Faster tasks should be yielded before slower ones."""
+        async def fake_run(task_data):
+            await asyncio.sleep(task_data["delay"])
+            return task_data["query"]
+        
+        mock_edison.arun_tasks_until_done = AsyncMock(side_effect=fake_run)
+        
+        client = EdisonPlatformClient(api_key="test_key")
+        tasks = [
+            {"name": JobNames.LITERATURE, "query": "slow", "delay": 0.05},
+            {"name": JobNames.LITERATURE, "query": "fast", "delay": 0},
+        ]
+        results = [result async for result in client.arun_tasks(tasks, concurrency=2)]
+        
+        assert results == ["fast", "slow"]
+        assert mock_edison.arun_tasks_until_done.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_arun_task_coalesces_concurrent_duplicates(self, mock_edison):
+        """Identical tasks submitted concurrently should share one request."""
+        async def fake_run(task_data):
+            await asyncio.sleep(0.01)
+            return {"status": "success", "query": task_data["query"]}
+        
+        mock_edison.arun_tasks_until_done = AsyncMock(side_effect=fake_run)
+        
+        client = EdisonPlatformClient(api_key="test_key")
+        task_data = {"name": JobNames.LITERATURE, "query": "test query"}
+        results = await asyncio.gather(
+            client.arun_task(task_data),
+            client.arun_task(dict(task_data)),
+            client.arun_task({"name": JobNames.LITERATURE, "query": "other query"}),
+        )
+        
+        assert results[0] == results[1] == {"status": "success", "query": "test query"}
+        assert results[2]["query"] == "other query"
+        assert mock_edison.arun_tasks_until_done.call_count == 2
+        
+        # Once finished, the same task runs again rather than reusing the result
+        await client.arun_task(task_data)
+        assert mock_edison.arun_tasks_until_done.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_finished_task_keeps_newer_inflight_entry(self, mock_edison):
+        """A finished task's cleanup must not drop a newer call registered under its key."""
+        loop = asyncio.get_running_loop()
+        old_task, new_task = loop.create_future(), loop.create_future()
+        
+        client = EdisonPlatformClient(api_key="test_key")
+        client._inflight["key"] = [new_task, 1]
+        client._forget_inflight("key", old_task)
+        assert client._inflight["key"][0] is new_task
+        
+        client._forget_inflight("key", new_task)
+        assert "key" not in client._inflight
 
 
 if __name__ == "__main__":
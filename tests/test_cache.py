@@ -0,0 +1,115 @@
+"""
+Unit tests for CachedEdisonClient.
+"""
+
+import sys
+
+import pytest
+from types import SimpleNamespace
+from edison_platform import CachedEdisonClient
+from edison_client import JobNames
+
+
+class TestCachedEdisonClient:
+    """Test CachedEdisonClient class."""
+    
+    def test_normalized_query_hits_cache(self, mock_edison):
+        """Queries differing only in case and whitespace should share a result."""
+        mock_edison.run_tasks_until_done.return_value = [{"status": "success", "answer": "ok"}]
+        
+        client = CachedEdisonClient(api_key="test_key", verbose=False, show_progress=False)
+        client.literature_search("What causes ALS?")
+        result = client.literature_search("  what causes\nALS? ")
+        
+        assert result == [{"status": "success", "answer": "ok"}]
+        assert mock_edison.run_tasks_until_done.call_count == 1
+        
+        # A different job type must not reuse the literature answer
+        client.precedent_search("What causes ALS?")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+    
+    @pytest.mark.parametrize("status", ["fail", "cancelled", "in progress", "queued"])
+    def test_unsuccessful_responses_are_not_cached(self, mock_edison, tmp_path, status):
+        """A failed or timed-out task should be retried, and never persisted."""
+        mock_edison.run_tasks_until_done.return_value = [SimpleNamespace(status=status)]
+        cache_path = str(tmp_path / "cache.sqlite")
+        
+        client = CachedEdisonClient(api_key="test_key", verbose=False, cache_path=cache_path)
+        client.literature_search("test query")
+        client.literature_search("test query")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+        
+        CachedEdisonClient(api_key="test_key", verbose=False, cache_path=cache_path).literature_search("test query")
+        assert mock_edison.run_tasks_until_done.call_count == 3
+    
+    def test_similarity_threshold(self, mock_edison):
+        """Near-identical queries should only match when a threshold is set."""
+        mock_edison.run_tasks_until_done.return_value = [{"status": "success"}]
+        
+        exact = CachedEdisonClient(api_key="test_key", verbose=False, show_progress=False)
+        exact.literature_search("What are the latest treatments for diabetes?")
+        exact.literature_search("What are the latest treatments for diabetes")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+        
+        mock_edison.run_tasks_until_done.reset_mock()
+        fuzzy = CachedEdisonClient(
+            api_key="test_key", verbose=False, show_progress=False, similarity_threshold=0.92
+        )
+        fuzzy.literature_search("What are the latest treatments for diabetes?")
+        fuzzy.literature_search("What are the latest treatments for diabetes")
+        fuzzy.literature_search("Which genes are linked to autism?")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+    
+    def test_cache_persists_to_sqlite(self, mock_edison, tmp_path):
+        """A new client pointed at the same file should start with a warm cache."""
+        mock_edison.run_tasks_until_done.return_value = [{"status": "success", "answer": "ok"}]
+        cache_path = str(tmp_path / "cache.sqlite")
+        
+        task = {"name": JobNames.PRECEDENT, "query": "Has anyone cured ALS?"}
+        CachedEdisonClient(api_key="test_key", verbose=False, cache_path=cache_path).run_task(task)
+        
+        client = CachedEdisonClient(api_key="test_key", verbose=False, cache_path=cache_path)
+        assert client.run_task(task) == [{"status": "success", "answer": "ok"}]
+        assert mock_edison.run_tasks_until_done.call_count == 1
+        
+        client.clear_cache()
+        CachedEdisonClient(api_key="test_key", verbose=False, cache_path=cache_path).run_task(task)
+        assert mock_edison.run_tasks_until_done.call_count == 2
+    
+    def test_concurrent_tasks_share_cache_safely(self, mock_edison):
+        """iter_tasks worker threads should not corrupt the cache or each other's lookups."""
+        mock_edison.run_tasks_until_done.side_effect = lambda task: [{"status": "success", "query": task["query"]}]
+        
+        client = CachedEdisonClient(
+            api_key="test_key", verbose=False, show_progress=False,
+            maxsize=8, similarity_threshold=0.99,
+        )
+        tasks = [
+            {"name": JobNames.LITERATURE, "query": f"query number {i % 50}"}
+            for i in range(2000)
+        ]
+        # Switch threads as often as possible so unguarded cache access races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            results = list(client.iter_tasks(tasks, max_workers=16))
+        finally:
+            sys.setswitchinterval(interval)
+        
+        assert len(results) == 2000
+    
+    @pytest.mark.asyncio
+    async def test_arun_task_uses_cache(self, mock_edison):
+        """The async path should share the cache with the sync one."""
+        mock_edison.run_tasks_until_done.return_value = [{"status": "success"}]
+        
+        client = CachedEdisonClient(api_key="test_key", verbose=False, show_progress=False)
+        task = {"name": JobNames.LITERATURE, "query": "test query"}
+        client.run_task(task)
+        
+        assert await client.arun_task(task) == [{"status": "success"}]
+        mock_edison.arun_tasks_until_done.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
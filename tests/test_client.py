@@ -2,227 +2,470 @@
 Unit tests for Edison Platform Client.
 """
 
+import asyncio
+import json
+import logging
+import threading
+from types import SimpleNamespace
+
 import pytest
-import os
-from unittest.mock import Mock, patch
-from edison_platform import EdisonPlatformClient, JobTypes
-from edison_client import JobNames
+
+
+# The exact query analyze_data builds for dataset_1 with one parameter
+EXPECTED_ANALYZE_QUERY = "Dataset: dataset_1\nParameters:\n- analysis_type: differential"
+
+# Every test here talks to a mocked EdisonClient and can run in any worker
+pytestmark = [pytest.mark.usefixtures("edison_client_cls"), pytest.mark.parallel]
+
+
+@pytest.fixture(scope="module")
+def shared_client(sdk):
+    """One EdisonPlatformClient built for the whole module."""
+    return sdk.EdisonPlatformClient(api_key="test_key")
+
+
+@pytest.fixture
+def client(shared_client, mock_edison):
+    """The module's client, wired to this test's mock with empty caches."""
+    shared_client.client = mock_edison
+    shared_client._task_cache.clear()
+    shared_client._query_cache.clear()
+    return shared_client
+
+
+def stub_client(**returns):
+    """
+    A plain stand-in for EdisonClient whose methods return fixed values.
+    
+    Every call's single argument is appended to ``calls``, which is cheaper
+    to build and check than a Mock when only return values matter.
+    """
+    calls = []
+    
+    def method(value):
+        def call(arg):
+            calls.append(arg)
+            return value
+        return call
+    
+    return SimpleNamespace(calls=calls, **{name: method(value) for name, value in returns.items()})
+
+
+class LoopBoundClient:
+    """
+    A stand-in for EdisonClient with its real lifetime rules.
+    
+    Like the SDK's aiohttp session, it is bound to the first event loop that
+    uses it, and it refuses calls once closed.
+    """
+    
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self._closed = False
+        self._loop = None
+    
+    async def arun_tasks_until_done(self, task_data):
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        # Every poll of the task goes through the client again
+        for _ in range(3):
+            if self._closed:
+                raise RuntimeError("RestClient has been closed")
+            if self._loop is not loop:
+                raise RuntimeError("Event loop is closed")
+            await asyncio.sleep(0)
+        return [{"status": "success"}]
+    
+    def close(self):
+        self._closed = True
+    
+    async def aclose(self):
+        self._closed = True
 
 
 class TestJobTypes:
     """Test JobTypes enum."""
     
-    def test_job_types_values(self):
-        """Test that all job types have correct values."""
-        assert JobTypes.LITERATURE.value == "LITERATURE"
-        assert JobTypes.ANALYSIS.value == "ANALYSIS"
-        assert JobTypes.PRECEDENT.value == "PRECEDENT"
-        assert JobTypes.MOLECULES.value == "MOLECULES"
+    @pytest.mark.parametrize("member, value", [
+        ("LITERATURE", "LITERATURE"),
+        ("ANALYSIS", "ANALYSIS"),
+        ("PRECEDENT", "PRECEDENT"),
+        ("MOLECULES", "MOLECULES"),
+    ])
+    def test_job_types_values(self, sdk, member, value):
+        """Test that each job type has the correct value."""
+        assert sdk.JobTypes[member].value == value
     
-    def test_get_description(self):
-        """Test that descriptions are returned correctly."""
-        desc = JobTypes.get_description(JobTypes.LITERATURE)
-        assert "literature" in desc.lower()
-        
-        desc = JobTypes.get_description(JobTypes.ANALYSIS)
-        assert "dataset" in desc.lower() or "analysis" in desc.lower()
+    @pytest.mark.parametrize("member, keywords", [
+        ("LITERATURE", ("literature",)),
+        ("ANALYSIS", ("dataset", "analysis")),
+        ("PRECEDENT", ("prior",)),
+        ("MOLECULES", ("chemistry",)),
+    ])
+    def test_get_description(self, sdk, member, keywords):
+        """Each description should mention what the job type does."""
+        desc = sdk.JobTypes.get_description(sdk.JobTypes[member]).casefold()
+        assert any(keyword in desc for keyword in keywords)
+    
+    def test_job_type_by_value(self, sdk):
+        """Test the string-to-member lookup table."""
+        assert sdk.JOBTYPE_BY_VALUE["MOLECULES"] is sdk.JobTypes.MOLECULES
+        assert len(sdk.JOBTYPE_BY_VALUE) == len(sdk.JobTypes)
 
 
 class TestEdisonPlatformClient:
     """Test EdisonPlatformClient class."""
     
-    @patch('edison_platform.client.EdisonClient')
-    def test_init_with_api_key(self, mock_edison_client):
-        """Test client initialization with API key."""
-        mock_client_instance = Mock()
-        mock_edison_client.return_value = mock_client_instance
-        
-        client = EdisonPlatformClient(api_key="test_key")
-        assert client.api_key == "test_key"
-        assert client.client is not None
-        mock_edison_client.assert_called_once_with(api_key="test_key")
-    
-    def test_init_without_api_key_raises_error(self):
-        """Test that initialization without API key raises ValueError."""
-        # Clear environment variable if it exists
-        old_key = os.environ.pop("EDISON_API_KEY", None)
-        try:
+    @pytest.mark.parametrize("api_key, env_key, expected", [
+        pytest.param("test_key", None, "test_key", id="argument"),
+        pytest.param(None, "env_test_key", "env_test_key", id="environment"),
+        pytest.param(None, None, None, id="missing"),
+    ])
+    def test_init(self, sdk, edison_client_cls, mock_edison, monkeypatch, api_key, env_key, expected):
+        """The API key comes from the argument or the environment, and is required."""
+        if env_key is None:
+            monkeypatch.delenv("EDISON_API_KEY", raising=False)
+        else:
+            monkeypatch.setenv("EDISON_API_KEY", env_key)
+        
+        if expected is None:
             with pytest.raises(ValueError, match="API key is required"):
-                EdisonPlatformClient()
+                sdk.EdisonPlatformClient(api_key=api_key)
+            return
+        
+        client = sdk.EdisonPlatformClient(api_key=api_key)
+        assert client.api_key == expected
+        assert client.client is mock_edison
+        assert edison_client_cls.call_count == 1
+        assert edison_client_cls.call_args.kwargs == {"api_key": expected}
+    
+    def test_verbose_logging_respects_configured_application(self, sdk, monkeypatch):
+        """With root handlers already set, the package logger should be left alone."""
+        package_logger = logging.getLogger("edison_platform")
+        monkeypatch.setattr("edison_platform.client._LOGGING_READY", threading.Event())
+        monkeypatch.setattr(package_logger, "handlers", [])
+        monkeypatch.setattr(logging.getLogger(), "handlers", [logging.NullHandler()])
+        original_level = package_logger.level
+        package_logger.setLevel(logging.NOTSET)
+        try:
+            sdk.EdisonPlatformClient(api_key="test_key", verbose=True)
+            assert package_logger.level == logging.NOTSET
+            assert package_logger.handlers == []
         finally:
-            # Restore environment variable
-            if old_key:
-                os.environ["EDISON_API_KEY"] = old_key
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_init_with_env_variable(self, mock_edison_client):
-        """Test client initialization with environment variable."""
-        mock_client_instance = Mock()
-        mock_edison_client.return_value = mock_client_instance
-        
-        with patch.dict(os.environ, {"EDISON_API_KEY": "env_test_key"}):
-            client = EdisonPlatformClient()
-            assert client.api_key == "env_test_key"
-            mock_edison_client.assert_called_once_with(api_key="env_test_key")
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_run_task(self, mock_edison_client):
+            package_logger.setLevel(original_level)
+    
+    def test_client_uses_slots(self, sdk):
+        """Instances should not carry a per-instance __dict__."""
+        client = sdk.EdisonPlatformClient(api_key="test_key")
+        assert not hasattr(client, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected_attribute = True
+    
+    def test_underlying_client_is_lazy(self, sdk, edison_client_cls):
+        """The EdisonClient should be built on first use, once per wrapper."""
+        client = sdk.EdisonPlatformClient(api_key="test_key")
+        assert edison_client_cls.call_count == 0
+        
+        assert client.client is client.client
+        assert edison_client_cls.call_count == 1
+        assert edison_client_cls.call_args.kwargs == {"api_key": "test_key"}
+    
+    def test_closing_one_client_leaves_others_running(self, sdk, monkeypatch):
+        """Leaving one wrapper's context must not close a task running on another."""
+        monkeypatch.setattr('edison_platform.client.EdisonClient', LoopBoundClient)
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        
+        async def scenario():
+            running = sdk.EdisonPlatformClient(api_key="test_key", verbose=False)
+            in_flight = asyncio.ensure_future(running.arun_task(task_data))
+            async with sdk.EdisonPlatformClient(api_key="test_key", verbose=False) as other:
+                assert other.client is not None
+                # Close other only once the running task is mid-poll
+                while running._client is None or running._client._loop is None:
+                    await asyncio.sleep(0)
+            return await in_flight
+        
+        assert asyncio.run(scenario()) == [{"status": "success"}]
+    
+    def test_new_client_works_in_a_second_event_loop(self, sdk, monkeypatch):
+        """A fresh wrapper in a later asyncio.run should not reuse a closed loop's client."""
+        monkeypatch.setattr('edison_platform.client.EdisonClient', LoopBoundClient)
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        
+        async def scenario():
+            # Not closed on exit, as in a script that never uses the context manager
+            client = sdk.EdisonPlatformClient(api_key="test_key", verbose=False)
+            return await client.arun_task(task_data)
+        
+        assert asyncio.run(scenario()) == [{"status": "success"}]
+        assert asyncio.run(scenario()) == [{"status": "success"}]
+    
+    def test_context_manager_closes_connections(self, sdk, mock_edison):
+        """Leaving the context manager should release pooled connections."""
+        with sdk.EdisonPlatformClient(api_key="test_key") as client:
+            assert client.client is mock_edison
+        
+        assert mock_edison.close.call_count == 1
+        assert mock_edison.close.call_args.args == ()
+    
+    def test_run_task(self, sdk, client):
         """Test synchronous task execution."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"status": "completed"}
-        mock_edison_client.return_value = mock_client_instance
+        # Setup stub
+        client.client = stub = stub_client(run_tasks_until_done={"status": "completed"})
         
         # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        task_data = {"name": JobNames.LITERATURE, "query": "test query"}
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
         result = client.run_task(task_data)
         
         # Verify
         assert result == {"status": "completed"}
-        mock_client_instance.run_tasks_until_done.assert_called_once_with(task_data)
+        assert stub.calls == [task_data]
+    
+    def test_run_task_streaming(self, sdk, client, mock_edison, monkeypatch):
+        """Streaming should yield each status change, then the final result."""
+        mock_edison.create_task.return_value = "task_123"
+        mock_edison.get_task.side_effect = [
+            {"status": "queued"},
+            {"status": "in progress"},
+            {"status": "in progress"},
+            {"status": "success"},
+            {"status": "success", "answer": "done"},
+        ]
+        
+        sleeps = []
+        monkeypatch.setattr('edison_platform.client.time.sleep', sleeps.append)
+        
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        updates = list(client.run_task_streaming(task_data, poll_interval=1, max_poll_interval=2))
+        
+        assert updates == [
+            {"status": "queued"},
+            {"status": "in progress"},
+            {"status": "success", "answer": "done"},
+        ]
+        assert sleeps == [1, 2, 2]
+        # The final fetch is the full (non-lite) task
+        assert mock_edison.get_task.call_args.args == ("task_123",)
+        assert mock_edison.get_task.call_args.kwargs == {}
+    
+    def test_run_task_streaming_times_out(self, sdk, client, mock_edison, monkeypatch, caplog):
+        """A task that never finishes should stop being polled after the timeout."""
+        mock_edison.create_task.return_value = "task_123"
+        mock_edison.get_task.return_value = {"status": "in progress"}
+        
+        now = [0.0]
+        monkeypatch.setattr('edison_platform.client.time.monotonic', lambda: now[0])
+        monkeypatch.setattr('edison_platform.client.time.sleep', lambda seconds: now.__setitem__(0, now[0] + seconds))
+        
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        updates = list(client.run_task_streaming(task_data, poll_interval=1, max_poll_interval=4, timeout=10))
+        
+        assert updates == [{"status": "in progress"}, {"status": "in progress"}]
+        assert 10 <= now[0] < 14
+        assert "Timed out waiting for task task_123" in caplog.text
+    
+    def test_run_task_streaming_reports_failure(self, sdk, client, mock_edison, monkeypatch, capsys):
+        """A failed task should be announced in the error color, not the success one."""
+        mock_edison.create_task.return_value = "task_123"
+        mock_edison.get_task.return_value = {"status": "fail"}
+        monkeypatch.setattr('edison_platform.client._STATUS_COLORS', {"success": "<ok>", "error": "<error>"})
+        
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        assert list(client.run_task_streaming(task_data)) == [{"status": "fail"}]
+        assert "<error>" in capsys.readouterr().err
+    
+    def test_run_task_streaming_logs_errors(self, sdk, client, mock_edison, caplog):
+        """Polling errors should be logged before they propagate."""
+        mock_edison.create_task.return_value = "task_123"
+        mock_edison.get_task.side_effect = RuntimeError("connection lost")
+        
+        task_data = {"name": sdk.JobNames.LITERATURE, "query": "test query"}
+        with pytest.raises(RuntimeError, match="connection lost"):
+            list(client.run_task_streaming(task_data))
+        assert "Error streaming task: connection lost" in caplog.text
+    
+    def test_run_tasks_submits_batch(self, sdk, client, mock_edison):
+        """Batch runs should hand every task to the client in one call."""
+        mock_edison.run_tasks_until_done.return_value = ["first", "second"]
+        
+        tasks = [
+            {"name": sdk.JobNames.LITERATURE, "query": "first query"},
+            {"name": sdk.JobNames.PRECEDENT, "query": "second query"},
+        ]
+        results = client.run_tasks(iter(tasks))
+        
+        assert results == ["first", "second"]
+        assert mock_edison.run_tasks_until_done.call_count == 1
+        assert mock_edison.run_tasks_until_done.call_args.args == (tasks,)
+    
+    def test_iter_tasks_yields_every_result(self, sdk, mock_edison):
+        """Thread-pooled runs should yield one response per task."""
+        mock_edison.run_tasks_until_done.side_effect = lambda task: task["query"]
+        
+        client = sdk.EdisonPlatformClient(api_key="test_key", verbose=False, show_progress=False)
+        tasks = [{"name": sdk.JobNames.LITERATURE, "query": f"query {i}"} for i in range(5)]
+        results = list(client.iter_tasks(tasks, max_workers=3))
+        
+        assert sorted(results) == [f"query {i}" for i in range(5)]
+        assert mock_edison.run_tasks_until_done.call_count == 5
     
-    @patch('edison_platform.client.EdisonClient')
-    def test_create_task(self, mock_edison_client):
+    def test_run_task_without_name_fails_before_request(self, client, mock_edison):
+        """A missing job name should be rejected without calling the API."""
+        with pytest.raises(TypeError, match="must be a JobNames member"):
+            client.run_task({"query": "test query"})
+        
+        mock_edison.run_tasks_until_done.assert_not_called()
+    
+    def test_create_task(self, sdk, client):
         """Test task creation."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.create_task.return_value = "task_123"
-        mock_edison_client.return_value = mock_client_instance
+        # Setup stub
+        client.client = stub = stub_client(create_task="task_123")
         
         # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        task_data = {"name": JobNames.PRECEDENT, "query": "test query"}
+        task_data = {"name": sdk.JobNames.PRECEDENT, "query": "test query"}
         task_id = client.create_task(task_data)
         
         # Verify
         assert task_id == "task_123"
-        mock_client_instance.create_task.assert_called_once_with(task_data)
+        assert stub.calls == [task_data]
     
-    @patch('edison_platform.client.EdisonClient')
-    def test_get_task(self, mock_edison_client):
+    def test_get_task(self, client):
         """Test task retrieval."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.get_task.return_value = {"status": "completed", "result": "data"}
-        mock_edison_client.return_value = mock_client_instance
+        # Setup stub
+        client.client = stub = stub_client(get_task={"status": "completed", "result": "data"})
         
         # Test
-        client = EdisonPlatformClient(api_key="test_key")
         result = client.get_task("task_123")
         
         # Verify
         assert result == {"status": "completed", "result": "data"}
-        mock_client_instance.get_task.assert_called_once_with("task_123")
+        assert stub.calls == ["task_123"]
     
-    @patch('edison_platform.client.EdisonClient')
-    def test_literature_search_convenience_method(self, mock_edison_client):
-        """Test literature search convenience method."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"answer": "test answer"}
-        mock_edison_client.return_value = mock_client_instance
+    def test_get_task_caches_terminal_results(self, client, mock_edison):
+        """Finished tasks should be served from the cache on later polls."""
+        mock_edison.get_task.side_effect = [
+            {"status": "in progress"},
+            {"status": "success", "result": "data"},
+        ]
         
-        # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        result = client.literature_search("test query")
+        assert client.get_task("task_123") == {"status": "in progress"}
+        assert client.get_task("task_123") == {"status": "success", "result": "data"}
+        assert client.get_task("task_123") == {"status": "success", "result": "data"}
         
-        # Verify
+        assert mock_edison.get_task.call_count == 2
+        
+        client.invalidate_task("task_123")
+        mock_edison.get_task.side_effect = None
+        mock_edison.get_task.return_value = {"status": "success", "result": "new"}
+        assert client.get_task("task_123") == {"status": "success", "result": "new"}
+        assert mock_edison.get_task.call_count == 3
+    
+    def test_literature_search_use_cache(self, client, mock_edison):
+        """Identical queries should reuse the cached result only when asked to."""
+        mock_edison.run_tasks_until_done.return_value = {"answer": "test answer"}
+        
+        client.literature_search("test query", use_cache=True)
+        result = client.literature_search("test query", use_cache=True)
         assert result == {"answer": "test answer"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["name"] == JobNames.LITERATURE
-        assert call_args["query"] == "test query"
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_precedent_search_convenience_method(self, mock_edison_client):
-        """Test precedent search convenience method."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"result": "test result"}
-        mock_edison_client.return_value = mock_client_instance
+        assert mock_edison.run_tasks_until_done.call_count == 1
         
-        # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        result = client.precedent_search("test precedent query")
+        client.literature_search("test query")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+    
+    @pytest.mark.parametrize("status", ["fail", "cancelled", "in progress", "queued"])
+    def test_literature_search_use_cache_skips_unsuccessful(self, client, mock_edison, status):
+        """A failed or timed-out run should be retried rather than served from the query cache."""
+        # run_tasks_until_done returns a list of task results, even for one task
+        mock_edison.run_tasks_until_done.return_value = [SimpleNamespace(status=status)]
         
-        # Verify
-        assert result == {"result": "test result"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["name"] == JobNames.PRECEDENT
-        assert call_args["query"] == "test precedent query"
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_analyze_data_convenience_method(self, mock_edison_client):
-        """Test data analysis convenience method."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"analysis": "complete"}
-        mock_edison_client.return_value = mock_client_instance
+        client.literature_search("test query", use_cache=True)
+        client.literature_search("test query", use_cache=True)
         
-        # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        result = client.analyze_data("dataset_1", analysis_type="differential")
+        assert mock_edison.run_tasks_until_done.call_count == 2
+    
+    @pytest.mark.parametrize("method, args, kwargs, expected_name, expected_query", [
+        ("literature_search", ("test query",), {}, "LITERATURE", "test query"),
+        ("precedent_search", ("test precedent query",), {}, "PRECEDENT", "test precedent query"),
+        (
+            "analyze_data", ("dataset_1",), {"analysis_type": "differential"}, "ANALYSIS",
+            EXPECTED_ANALYZE_QUERY,
+        ),
+        (
+            "chemistry_task", ("design molecule",), {"target": "protein_x"}, "MOLECULES",
+            "design molecule\n\nParameters:\n- target: protein_x",
+        ),
+    ])
+    def test_convenience_methods(self, sdk, client, mock_edison, method, args, kwargs, expected_name, expected_query):
+        """Each convenience method should submit its job type with the built query."""
+        mock_edison.run_tasks_until_done.return_value = {"answer": "test answer"}
         
-        # Verify
-        assert result == {"analysis": "complete"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["name"] == JobNames.ANALYSIS
-        assert "Dataset: dataset_1" in call_args["query"]
-        assert "analysis_type: differential" in call_args["query"]
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_analyze_data_custom_query_and_overrides(self, mock_edison_client):
+        result = getattr(client, method)(*args, **kwargs)
+        
+        assert result == {"answer": "test answer"}
+        task_data = mock_edison.run_tasks_until_done.call_args.args[0]
+        assert task_data == {"name": sdk.JobNames[expected_name], "query": expected_query}
+    
+    def test_analyze_data_custom_query_and_overrides(self, sdk, client, mock_edison):
         """Ensure custom query text and overrides pass through untouched."""
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"analysis": "ok"}
-        mock_edison_client.return_value = mock_client_instance
+        mock_edison.run_tasks_until_done.return_value = {"analysis": "ok"}
         
-        client = EdisonPlatformClient(api_key="test_key")
         result = client.analyze_data(
             query="custom analysis plan",
             task_overrides={"metadata": {"priority": "high"}}
         )
         
         assert result == {"analysis": "ok"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["query"] == "custom analysis plan"
-        assert call_args["metadata"] == {"priority": "high"}
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_chemistry_task_convenience_method(self, mock_edison_client):
-        """Test chemistry task convenience method."""
-        # Setup mock
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"molecule": "designed"}
-        mock_edison_client.return_value = mock_client_instance
+        task_data = mock_edison.run_tasks_until_done.call_args.args[0]
+        assert task_data == {
+            "name": sdk.JobNames.ANALYSIS,
+            "query": "custom analysis plan",
+            "metadata": {"priority": "high"},
+        }
+    
+    def test_chemistry_task_nested_parameters(self, client, mock_edison):
+        """Nested parameters should render as indented, key-sorted JSON."""
+        mock_edison.run_tasks_until_done.return_value = {"molecule": "ok"}
         
-        # Test
-        client = EdisonPlatformClient(api_key="test_key")
-        result = client.chemistry_task("design molecule", target="protein_x")
+        constraints = {"safety": "low toxicity", "delivery": "oral"}
+        client.chemistry_task("design molecule", constraints=constraints)
         
-        # Verify
-        assert result == {"molecule": "designed"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["name"] == JobNames.MOLECULES
-        assert "design molecule" in call_args["query"]
-        assert "target: protein_x" in call_args["query"]
-    
-    @patch('edison_platform.client.EdisonClient')
-    def test_chemistry_task_with_overrides(self, mock_edison_client):
+        task_data = mock_edison.run_tasks_until_done.call_args.args[0]
+        expected = json.dumps(constraints, indent=2, sort_keys=True)
+        assert task_data["query"] == f"design molecule\n\nParameters:\n- constraints: {expected}"
+    
+    @pytest.mark.parametrize("constraints", [
+        pytest.param({"solvent": "éthanol", "note": "\u2028"}, id="non-ascii"),
+        pytest.param({"ic50": float("nan"), "dose": 1e-07}, id="floats"),
+        pytest.param({"atoms": 2 ** 70}, id="wide-int"),
+        pytest.param({1: "one", 2: "two"}, id="int-keys"),
+    ])
+    def test_chemistry_task_parameters_match_json(self, client, mock_edison, constraints):
+        """Parameter JSON should read exactly as json.dumps writes it, whatever the encoder."""
+        mock_edison.run_tasks_until_done.return_value = {"molecule": "ok"}
+        
+        client.chemistry_task("design molecule", constraints=constraints)
+        
+        task_data = mock_edison.run_tasks_until_done.call_args.args[0]
+        expected = json.dumps(constraints, indent=2, sort_keys=True)
+        assert task_data["query"] == f"design molecule\n\nParameters:\n- constraints: {expected}"
+    
+    def test_chemistry_task_with_overrides(self, sdk, client, mock_edison):
         """Chemistry task should support passing task_overrides."""
-        mock_client_instance = Mock()
-        mock_client_instance.run_tasks_until_done.return_value = {"molecule": "ok"}
-        mock_edison_client.return_value = mock_client_instance
+        mock_edison.run_tasks_until_done.return_value = {"molecule": "ok"}
         
-        client = EdisonPlatformClient(api_key="test_key")
         result = client.chemistry_task(
             "design molecule",
             task_overrides={"metadata": {"priority": "rush"}}
         )
         
         assert result == {"molecule": "ok"}
-        call_args = mock_client_instance.run_tasks_until_done.call_args[0][0]
-        assert call_args["metadata"] == {"priority": "rush"}
+        task_data = mock_edison.run_tasks_until_done.call_args.args[0]
+        assert task_data == {
+            "name": sdk.JobNames.MOLECULES,
+            "query": "design molecule",
+            "metadata": {"priority": "rush"},
+        }
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""
+Unit tests for environment loading.
+"""
+
+import os
+
+import pytest
+from edison_platform import ensure_env_loaded
+
+
+def test_ensure_env_loaded_runs_once():
+    """Repeated calls should parse the .env file only once."""
+    calls = []
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('edison_platform.env.load_dotenv', lambda path: calls.append(path) or True)
+        assert ensure_env_loaded() is True
+        assert ensure_env_loaded() is True
+        assert len(calls) == 1
+
+
+def test_ensure_env_loaded_searches_from_working_directory(tmp_path, monkeypatch):
+    """The .env file should be found from the working directory, not from the package."""
+    (tmp_path / ".env").write_text("EDISON_ENV_TEST_VALUE=from_dotenv\n")
+    monkeypatch.chdir(tmp_path)
+    # setenv records the variable so it is removed again after the test
+    monkeypatch.setenv("EDISON_ENV_TEST_VALUE", "")
+    monkeypatch.delenv("EDISON_ENV_TEST_VALUE")
+    
+    assert ensure_env_loaded() is True
+    assert os.environ["EDISON_ENV_TEST_VALUE"] == "from_dotenv"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
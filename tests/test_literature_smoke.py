@@ -0,0 +1,27 @@
+"""
+Live smoke tests against the Edison platform.
+
+These run real tasks and are skipped unless EDISON_API_KEY is set (directly
+or through a .env file). Add a row to SMOKE_QUERIES to cover a new query.
+"""
+
+import pytest
+
+# The basic usage query from the README
+README_QUERY = "Which neglected diseases had a treatment developed by artificial intelligence?"
+
+SMOKE_QUERIES = [README_QUERY]
+
+
+@pytest.mark.parametrize("query", SMOKE_QUERIES)
+def test_literature_search(live_client, query):
+    """A literature search should complete successfully with a response."""
+    # run_tasks_until_done returns one task result per submitted task
+    results = live_client.literature_search(query)
+    
+    assert results
+    assert all(live_client._status_of(result) == "success" for result in results)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])